@@ -0,0 +1,242 @@
+
+import math
+
+# Built-in lexicons. Keep these short and common; callers can pass their own word list.
+EN_WORDS = [
+    "HELLO", "HI", "YES", "NO", "OK", "THANKS", "THANK", "YOU", "PLEASE", "SORRY",
+    "HELP", "WATER", "FOOD", "EAT", "DRINK", "GOOD", "BAD", "FINE", "LOVE", "NAME",
+    "MY", "ME", "I", "A", "AN", "THE", "AND", "IS", "ARE", "HOW", "WHAT", "WHERE",
+    "WHO", "WHY", "WHEN", "NOW", "LATER", "HOME", "WORK", "SCHOOL", "FRIEND",
+    "FAMILY", "MOTHER", "FATHER", "DAY", "NIGHT", "MORE", "STOP", "GO", "COME",
+    "WANT", "NEED", "LIKE", "CALL", "BYE", "MORNING", "TODAY", "TOMORROW",
+]
+
+AR_WORDS = [
+    "مرحبا", "أهلا", "سلام", "نعم", "لا", "شكرا", "من", "فضلك", "آسف", "ماء",
+    "أكل", "طعام", "مساعدة", "جيد", "تمام", "أحبك", "اسم", "اسمي", "أنا", "أنت",
+    "هو", "هي", "كيف", "ماذا", "أين", "متى", "لماذا", "بيت", "عمل", "مدرسة",
+    "صديق", "عائلة", "أم", "أب", "يوم", "ليل", "صباح", "مساء", "المزيد", "قف",
+]
+
+# The ArSL classifier only emits a single alef form and has no ta marbuta, alef
+# maqsura or hamza, so lexicon words are keyed on a normalized spelling.
+_AR_NORMALIZE = {"ا": "أ", "إ": "أ", "آ": "أ", "ة": "ه", "ى": "ي", "ئ": "ي", "ؤ": "و", "ء": ""}
+
+
+def normalize_letters(word, language='EN'):
+    """Returns the letter sequence the classifier would produce when spelling `word`."""
+    if language == 'EN':
+        return [c for c in word.upper() if c.isalpha()]
+    letters = [_AR_NORMALIZE.get(c, c) for c in word if not c.isspace()]
+    return [c for c in letters if c]
+
+
+class LexiconTrie:
+    """Prefix trie over classifier letters. Terminal nodes keep the surface word."""
+
+    class Node:
+        __slots__ = ("children", "word")
+
+        def __init__(self):
+            self.children = {}
+            self.word = None
+
+    def __init__(self, words=(), language='EN'):
+        self.language = language
+        self.root = LexiconTrie.Node()
+        for w in words:
+            self.insert(w)
+
+    def insert(self, word):
+        node = self.root
+        for letter in normalize_letters(word, self.language):
+            node = node.children.setdefault(letter, LexiconTrie.Node())
+        if node is not self.root:
+            node.word = word
+
+
+class _Hypothesis:
+    __slots__ = ("letters", "node", "score")
+
+    def __init__(self, letters, node, score):
+        self.letters = letters  # tuple of emitted letters
+        self.node = node        # trie node, or None once off-lexicon
+        self.score = score      # log probability (with penalties)
+
+    def text(self):
+        if self.node is not None and self.node.word is not None:
+            return self.node.word
+        return "".join(self.letters)
+
+
+class FingerspellingDecoder:
+    """
+    Streaming fingerspelling decoder for LETTERS mode.
+
+    Feed it the smoothed label scores for every frame (e.g. label counts over the
+    prediction buffer). A letter is emitted once the top label has been held for
+    `letter_hold` seconds; each emission extends a beam of hypotheses over the
+    lexicon trie using the scores averaged over the hold. Tracking dropouts shorter
+    than `dropout` are bridged; a longer gap is a release, after which the same
+    letter can be signed again (B-O-O-K). A gap of `pause` seconds ends the word,
+    which is then committed as the best lexicon word within `commit_margin` of the
+    best hypothesis, or as spelled.
+
+    Holding a letter emits it once. Double letters come from re-signing after a
+    release, or from the lexicon (HELO -> HELLO); `repeat_hold` opts in to
+    re-emitting a letter held that long.
+
+    Memory per session is bounded by `beam_width` and `max_word_len`.
+    """
+
+    def __init__(self, language='EN', words=None, beam_width=8, max_word_len=16,
+                 letter_hold=0.5, repeat_hold=None, dropout=0.15, pause=0.8, min_prob=0.15,
+                 oov_penalty=3.0, double_penalty=1.0, commit_margin=1.5):
+        self.beam_width = beam_width
+        self.max_word_len = max_word_len
+        self.letter_hold = letter_hold    # seconds the top label must hold to emit a letter
+        self.repeat_hold = repeat_hold    # seconds to hold the same letter to emit it again; None = never
+        self.dropout = dropout            # gaps shorter than this are tracking noise, not a release
+        self.pause = pause                # seconds without a sign before the current word is committed
+        self.min_prob = min_prob          # labels below this share of the hold are not considered
+        self.oov_penalty = oov_penalty    # log-score penalty per off-lexicon letter
+        self.double_penalty = double_penalty  # log-score penalty for an implied double letter
+        self.commit_margin = commit_margin  # how far below the best a lexicon word may score and still win
+        self._custom_words = words
+        self.set_language(language)
+
+    def set_language(self, language):
+        self.language = language
+        if self._custom_words is not None:
+            words = self._custom_words
+        else:
+            words = EN_WORDS if language == 'EN' else AR_WORDS
+        self.lexicon = LexiconTrie(words, language)
+        self.reset()
+
+    def reset(self):
+        self.beam = self._new_beam()
+        self._segment_label = None
+        self._segment_since = 0.0
+        self._segment_scores = {}
+        self._segment_frames = 0
+        self._segment_emitted = False
+        self._last_sign_time = None
+
+    def _new_beam(self):
+        return [_Hypothesis((), self.lexicon.root, 0.0)]
+
+    def pending(self):
+        """Best hypothesis for the word currently being spelled (not yet committed)."""
+        return self.beam[0].text() if self.beam[0].letters else ""
+
+    def update(self, scores, t):
+        """
+        Advances the decoder by one frame.
+
+        `scores` maps label -> score (need not be normalized); an empty dict means
+        no sign this frame. Returns the committed word, or "" if nothing committed.
+        """
+        scores = {k: v for k, v in scores.items() if k.isalpha() and v > 0}
+        if not scores:
+            if self._last_sign_time is None:
+                return ""
+            gap = t - self._last_sign_time
+            # Dropouts are bridged: the current segment (and whether it already
+            # emitted) survives, so flicker neither drops nor duplicates a letter.
+            if gap < self.dropout:
+                return ""
+            # Release: the same letter may be signed again
+            self._segment_label = None
+            self._segment_scores = {}
+            self._segment_frames = 0
+            self._segment_emitted = False
+            if gap >= self.pause:
+                self._last_sign_time = None
+                return self.flush()
+            return ""
+
+        self._last_sign_time = t
+        top = max(scores, key=scores.get)
+        if top != self._segment_label:
+            self._segment_label = top
+            self._segment_since = t
+            self._segment_scores = {}
+            self._segment_frames = 0
+            self._segment_emitted = False
+
+        total = sum(scores.values())
+        for label, s in scores.items():
+            self._segment_scores[label] = self._segment_scores.get(label, 0.0) + s / total
+        self._segment_frames += 1
+
+        if self._segment_emitted:
+            if self.repeat_hold is None:
+                return ""
+            hold = self.repeat_hold
+        else:
+            hold = self.letter_hold
+        if t - self._segment_since < hold:
+            return ""
+
+        dist = {k: v / self._segment_frames for k, v in self._segment_scores.items()}
+        self._segment_since = t
+        self._segment_scores = {}
+        self._segment_frames = 0
+        self._segment_emitted = True
+        word = ""
+        if len(self.beam[0].letters) >= self.max_word_len:
+            # Runaway word: commit it and start a new one with this letter
+            word = self.flush()
+        self._extend(dist)
+        return word
+
+    def flush(self):
+        """
+        Commits the current word (end of word). A lexicon word is preferred over
+        what was spelled only if it scores within `commit_margin` of the best.
+        """
+        best = self.beam[0]
+        if not best.letters:
+            return ""
+        floor = best.score - self.commit_margin
+        for h in self.beam:
+            if h.score < floor:
+                break
+            if h.node is None:
+                continue
+            if h.node.word is not None:
+                best = h
+                break
+            # Word ending in a double letter (CAL -> CALL)
+            last = h.node.children.get(h.letters[-1])
+            if last is not None and last.word is not None and h.score - self.double_penalty >= floor:
+                best = _Hypothesis(h.letters + (h.letters[-1],), last, h.score - self.double_penalty)
+                break
+        self.beam = self._new_beam()
+        return best.text()
+
+    def _extend(self, dist):
+        candidates = [(k, p) for k, p in dist.items() if p >= self.min_prob]
+        if not candidates:
+            candidates = [max(dist.items(), key=lambda kv: kv[1])]
+
+        new_beam = []
+        for h in self.beam:
+            starts = [h]
+            # Double letters are hard to sign as two separate holds, so let the
+            # lexicon imply one (HELO -> HELLO) at a small cost.
+            if h.node is not None and h.letters and h.letters[-1] in h.node.children:
+                last = h.letters[-1]
+                starts.append(_Hypothesis(h.letters + (last,), h.node.children[last],
+                                          h.score - self.double_penalty))
+            for start in starts:
+                for label, p in candidates:
+                    score = start.score + math.log(p)
+                    node = start.node.children.get(label) if start.node is not None else None
+                    if node is None:
+                        score -= self.oov_penalty
+                    new_beam.append(_Hypothesis(start.letters + (label,), node, score))
+
+        new_beam.sort(key=lambda h: h.score, reverse=True)
+        self.beam = new_beam[:self.beam_width]
@@ -5,6 +5,7 @@ import numpy as np
 import pyttsx3
 import time
 from sign_classifier import SignClassifier
+from fingerspelling_decoder import FingerspellingDecoder
 from PIL import Image, ImageDraw, ImageFont
 import arabic_reshaper
 from bidi.algorithm import get_display
@@ -30,6 +31,7 @@ class SignLanguageApp:
 
         # Classifier
         self.classifier = SignClassifier()
+        self.decoder = FingerspellingDecoder(language='EN') # LETTERS mode: letters -> lexicon words
         
         # State
         self.language = 'EN' # EN | AR
@@ -94,9 +96,20 @@ class SignLanguageApp:
                 self.last_pred = final_sign
                 self.speak(final_sign)
 
-            # Auto-append to text field after holding the same sign for ~1.5s
             t = time.time()
-            if final_sign and final_sign not in ("?", "..."):
+            if self.mode == 'LETTERS':
+                # Letters go through the lexicon decoder (short holds); it commits whole words.
+                # Only real letters are fed to it (e.g. no "🤟").
+                scores = {}
+                if current_sign.isalpha():
+                    for s in self.pred_buffer:
+                        if s.isalpha():
+                            scores[s] = scores.get(s, 0) + 1
+                word = self.decoder.update(scores, t)
+                if word:
+                    self.accumulated_text += (" " if self.accumulated_text else "") + word
+            # WORDS mode: auto-append to text field after holding the same sign for ~1.5s
+            elif final_sign and final_sign not in ("?", "..."):
                 if final_sign != self.current_stable_sign:
                     self.current_stable_sign = final_sign
                     self.stable_sign_since = t
@@ -119,22 +132,33 @@ class SignLanguageApp:
             if key == ord('q'):
                 break
             elif key == ord('l'):
+                self.commit_pending_word()
                 self.language = 'AR' if self.language == 'EN' else 'EN'
                 self.pred_buffer = []
                 self.last_pred = ""
                 self.last_appended_sign = ""
                 self.current_stable_sign = ""
+                self.decoder.set_language(self.language)
                 print(f"Switched to {self.language}")
             elif key == ord('m'):
+                self.commit_pending_word()
                 self.mode = 'WORDS' if self.mode == 'LETTERS' else 'LETTERS'
                 self.pred_buffer = []
                 self.last_pred = ""
                 self.last_appended_sign = ""
                 self.current_stable_sign = ""
+                self.decoder.reset()
                 print(f"Switched to {self.mode}")
             elif key == ord('a'):
                 # Manual append current sign to text field
-                if final_sign and final_sign not in ("?", "..."):
+                if self.mode == 'LETTERS':
+                    # Commit the word being spelled; with nothing pending, add the current letter as-is
+                    word = self.decoder.flush()
+                    if not word and final_sign.isalpha():
+                        word = final_sign
+                    if word:
+                        self.accumulated_text += (" " if self.accumulated_text else "") + word
+                elif final_sign and final_sign not in ("?", "..."):
                     self.accumulated_text += (" " if self.mode == 'WORDS' and self.accumulated_text else "") + final_sign
                     self.last_appended_sign = final_sign
                     self.current_stable_sign = final_sign
@@ -143,10 +167,17 @@ class SignLanguageApp:
                 self.accumulated_text = ""
                 self.last_appended_sign = ""
                 self.current_stable_sign = ""
+                self.decoder.reset()
 
         self.cap.release()
         cv2.destroyAllWindows()
 
+    def commit_pending_word(self):
+        # Move the word being spelled (LETTERS mode) into the text field so it is not lost
+        word = self.decoder.flush()
+        if word:
+            self.accumulated_text += (" " if self.accumulated_text else "") + word
+
     def speak(self, text):
         if not text or text == "..." or text == "?": return
         current_time = time.time()
@@ -175,7 +206,8 @@ class SignLanguageApp:
         draw.rectangle([(0,0), (W, 80)], fill=(30, 30, 30, 200)) # Semi-transparent
         
         # Status Text (and text field hint)
-        mode_text = f"Mode: {self.mode} | Lang: {self.language} | 'a'=Append 'c'=Clear"
+        cache_hit_rate = self.classifier.cache_stats()["hit_rate"]
+        mode_text = f"Mode: {self.mode} | Lang: {self.language} | Cache hits: {cache_hit_rate:.0%} | 'a'=Append 'c'=Clear"
         draw.text((20, 25), mode_text, font=None, fill=(200, 200, 200))
         
         # Result Box (Bottom Center) - current detection
@@ -188,7 +220,10 @@ class SignLanguageApp:
         field_y = 10
         field_h = 55
         draw.rectangle([(10, field_y), (W - 10, field_y + field_h)], fill=(40, 40, 50), outline=(150, 150, 200))
-        display_acc = self.accumulated_text or "(text appears here)"
+        pending = self.decoder.pending() if self.mode == 'LETTERS' else ""
+        if pending:
+            pending = (" " if self.accumulated_text else "") + pending + "_"
+        display_acc = (self.accumulated_text + pending) or "(text appears here)"
         try:
             acc_font = ImageFont.truetype("arial.ttf", 28)
         except Exception:
@@ -1,9 +1,40 @@
 
 import math
+import threading
+from collections import OrderedDict
 
 class SignClassifier:
-    def __init__(self):
-        pass
+    def __init__(self, cache_size=256):
+        # LRU cache of classify() results keyed by (mode, language, finger states).
+        # Finger states are wrist-relative and scale-free and decide the rule chain
+        # exactly, so cached and uncached results always match. cache_size=0 disables it.
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock() # One classifier may be shared by several Streamlit sessions
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+
+    def invalidate_cache(self):
+        """Drops all cached results and resets the statistics. Call after changing rule tables or models."""
+        with self._cache_lock:
+            self._cache.clear()
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.cache_evictions = 0
+
+    def cache_stats(self):
+        """Cache statistics since creation or the last invalidate_cache()."""
+        with self._cache_lock:
+            total = self.cache_hits + self.cache_misses
+            return {
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "evictions": self.cache_evictions,
+                "hit_rate": self.cache_hits / total if total else 0.0,
+            }
 
     def get_fingers_status(self, landmarks):
         """
@@ -57,7 +88,28 @@ class SignClassifier:
     def classify(self, landmarks, mode='LETTERS', language='EN'):
         fingers = self.get_fingers_status(landmarks)
         # fingers: [Thumb, Index, Middle, Ring, Pinky]
-        
+        if self.cache_size <= 0:
+            return self._classify(fingers, landmarks, mode, language)
+
+        key = (mode, language, tuple(fingers))
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return result
+            self.cache_misses += 1
+
+        result = self._classify(fingers, landmarks, mode, language)
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self.cache_evictions += 1
+        return result
+
+    def _classify(self, fingers, landmarks, mode, language):
         if mode == 'LETTERS':
             if language == 'EN':
                 return self._classify_asl(fingers, landmarks)
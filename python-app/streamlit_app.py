@@ -71,8 +71,16 @@ def load_mediapipe():
     mp_draw = mp.solutions.drawing_utils
     return hands, mp_draw
 
+@st.cache_resource
+def load_classifier():
+    # Shared across reruns/sessions (one script thread each); its result cache is lock-guarded
+    return SignClassifier()
+
 hands, mp_draw = load_mediapipe()
-classifier = SignClassifier()
+classifier = load_classifier()
+
+with st.sidebar:
+    st.caption(f"Classifier cache hit rate: {classifier.cache_stats()['hit_rate']:.0%}")
 
 # Main UI Layout
 col1, col2 = st.columns([3, 1])
@@ -0,0 +1,109 @@
+from fingerspelling_decoder import FingerspellingDecoder, LexiconTrie, normalize_letters
+
+FPS = 30
+
+
+def spell(decoder, letters, hold=0.7, dropout=False, t=0.0):
+    """Feeds `letters` at FPS, each held for `hold` seconds, then a long pause.
+    With `dropout`, one empty frame is inserted in the middle of every hold.
+    A float in `letters` is a gap (hand dropped) of that many seconds."""
+    out = []
+    frames = int(hold * FPS)
+    for letter in letters:
+        if isinstance(letter, float):
+            for _ in range(int(letter * FPS)):
+                word = decoder.update({}, t)
+                if word:
+                    out.append(word)
+                t += 1.0 / FPS
+            continue
+        scores = letter if isinstance(letter, dict) else {letter: 10}
+        for i in range(frames):
+            frame = {} if dropout and i == frames // 2 else scores
+            word = decoder.update(frame, t)
+            if word:
+                out.append(word)
+            t += 1.0 / FPS
+    for _ in range(int(2 * decoder.pause * FPS)):
+        word = decoder.update({}, t)
+        if word:
+            out.append(word)
+        t += 1.0 / FPS
+    return out
+
+
+def test_lexicon_word():
+    assert spell(FingerspellingDecoder(), "YES") == ["YES"]
+
+
+def test_single_frame_dropout_does_not_duplicate_or_drop():
+    assert spell(FingerspellingDecoder(), "CAT", hold=1.2, dropout=True) == ["CAT"]
+    assert spell(FingerspellingDecoder(), "CAT", hold=0.7, dropout=True) == ["CAT"]
+
+
+def test_long_hold_emits_once():
+    assert spell(FingerspellingDecoder(), "NO", hold=1.8) == ["NO"]
+
+
+def test_resigned_double_letter_after_hand_drop():
+    assert spell(FingerspellingDecoder(), ["B", "O", 0.3, "O", "K"]) == ["BOOK"]
+    assert spell(FingerspellingDecoder(), ["A", "N", 0.5, "N", "A"]) == ["ANNA"]
+
+
+def test_gap_of_pause_ends_word():
+    assert spell(FingerspellingDecoder(), ["B", "O", 0.9, "O", "K"]) == ["BO", "OK"]
+
+
+def test_repeat_hold_is_opt_in():
+    assert spell(FingerspellingDecoder(repeat_hold=1.0), "N", hold=1.8) == ["NN"]
+
+
+def test_out_of_lexicon_words_are_not_split():
+    for word in ["THEY", "HIM", "MEG", "YESTERDAY", "GOODWIN"]:
+        assert spell(FingerspellingDecoder(), word) == [word]
+
+
+def test_implied_double_letter():
+    assert spell(FingerspellingDecoder(), "HELO") == ["HELLO"]
+    assert spell(FingerspellingDecoder(), "CAL") == ["CALL"]
+
+
+def test_lexicon_resolves_ambiguous_letter():
+    assert spell(FingerspellingDecoder(), ["N", {"A": 5, "O": 5}]) == ["NO"]
+
+
+def test_lexicon_word_must_be_within_margin():
+    # Clearly spelled NA should not be replaced by the lexicon word NO
+    assert spell(FingerspellingDecoder(), ["N", {"A": 9, "O": 1}]) == ["NA"]
+
+
+def test_non_letter_labels_are_ignored():
+    assert spell(FingerspellingDecoder(), ["H", "🤟", "I"]) == ["HI"]
+
+
+def test_consecutive_words():
+    d = FingerspellingDecoder()
+    assert spell(d, "HI") + spell(d, "YOU") == ["HI", "YOU"]
+    assert d.pending() == ""
+
+
+def test_beam_is_bounded():
+    d = FingerspellingDecoder(beam_width=4, max_word_len=5)
+    out = spell(d, [{"X": 4, "Z": 3, "Q": 3}, {"Z": 4, "X": 3, "Q": 3}] * 4)
+    assert len(d.beam) <= 4
+    assert [len(w) for w in out] == [5, 3]
+
+
+def test_arabic_words_with_hamza():
+    d = FingerspellingDecoder(language='AR')
+    assert spell(d, normalize_letters("ماء", 'AR')) == ["ماء"]
+    assert spell(d, normalize_letters("مساء", 'AR')) == ["مساء"]
+    assert spell(d, normalize_letters("شكرا", 'AR')) == ["شكرا"]
+
+
+def test_trie_keeps_surface_word():
+    trie = LexiconTrie(["مدرسة"], 'AR')
+    node = trie.root
+    for letter in normalize_letters("مدرسة", 'AR'):
+        node = node.children[letter]
+    assert node.word == "مدرسة"
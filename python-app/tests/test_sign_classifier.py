@@ -0,0 +1,87 @@
+import random
+from types import SimpleNamespace
+
+from sign_classifier import SignClassifier
+
+
+def hand(open_fingers, dx=0.0, dy=0.0, scale=1.0):
+    """Synthetic landmarks for [Index, Middle, Ring, Pinky] open/closed, thumb tucked."""
+    pts = [(0.5, 0.8)] * 21
+    pts[3], pts[4] = (0.45, 0.7), (0.48, 0.74)  # thumb tip closer to the wrist than IP: tucked
+    pts[9] = (0.5, 0.6)
+    for (pip, tip), up in zip([(6, 8), (10, 12), (14, 16), (18, 20)], open_fingers):
+        pts[pip] = (0.5, 0.55)
+        pts[tip] = (0.5, 0.45 if up else 0.65)
+    return [SimpleNamespace(x=0.5 + (x - 0.5) * scale + dx, y=0.8 + (y - 0.8) * scale + dy, z=0.0)
+            for x, y in pts]
+
+
+def test_cache_disabled():
+    c = SignClassifier(cache_size=0)
+    assert c.classify(hand([1, 0, 0, 0])) == "D"
+    assert c.cache_stats()["size"] == 0
+    assert c.cache_stats()["misses"] == 0
+
+
+def test_hit_on_translated_and_scaled_pose():
+    c = SignClassifier(cache_size=8)
+    assert c.classify(hand([1, 1, 0, 0])) == "V"
+    assert c.classify(hand([1, 1, 0, 0], dx=0.1, dy=-0.05, scale=0.7)) == "V"
+    stats = c.cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_near_boundary_poses_match_uncached():
+    c, ref = SignClassifier(cache_size=8), SignClassifier(cache_size=0)
+    below, above = hand([1, 0, 0, 0]), hand([1, 0, 0, 0])
+    below[8].y = below[6].y + 0.01
+    above[8].y = above[6].y - 0.01
+    assert c.classify(below) == ref.classify(below) == "S"
+    assert c.classify(above) == ref.classify(above) == "D"
+
+
+def test_cached_results_always_match_uncached():
+    rng = random.Random(0)
+    c, ref = SignClassifier(cache_size=16), SignClassifier(cache_size=0)
+    for _ in range(2000):
+        pose = [SimpleNamespace(x=rng.random(), y=rng.random(), z=0.0) for _ in range(21)]
+        for mode in ('LETTERS', 'WORDS'):
+            for language in ('EN', 'AR'):
+                assert c.classify(pose, mode, language) == ref.classify(pose, mode, language)
+    assert c.cache_stats()["hits"] > 0
+
+
+def test_key_includes_mode_and_language():
+    c = SignClassifier(cache_size=8)
+    pose = hand([1, 0, 0, 0])
+    assert c.classify(pose, 'LETTERS', 'EN') == "D"
+    assert c.classify(pose, 'LETTERS', 'AR') == "أ"
+    assert c.classify(pose, 'WORDS', 'EN') == "One"
+    assert c.cache_stats()["misses"] == 3
+
+
+def test_lru_eviction_order():
+    c = SignClassifier(cache_size=2)
+    a, b, d = hand([1, 0, 0, 0]), hand([1, 1, 0, 0]), hand([0, 0, 0, 1])
+    c.classify(a)
+    c.classify(b)
+    c.classify(a)  # a is now most recently used
+    c.classify(d)  # evicts b
+    assert c.cache_stats()["evictions"] == 1
+    c.classify(a)
+    assert c.cache_stats()["hits"] == 2
+    c.classify(b)
+    assert c.cache_stats()["misses"] == 4
+
+
+def test_invalidate_clears_entries_and_stats():
+    c = SignClassifier(cache_size=4)
+    pose = hand([1, 0, 0, 0])
+    c.classify(pose)
+    c.classify(pose)
+    c.invalidate_cache()
+    assert c.cache_stats() == {"size": 0, "max_size": 4, "hits": 0, "misses": 0,
+                               "evictions": 0, "hit_rate": 0.0}
+    c.classify(pose)
+    assert c.cache_stats()["misses"] == 1